@@ -1,15 +1,23 @@
 """Executive Orders PDF Downloader and Merger."""
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
 
-from executive_orders_pdf.cli import cli
-from executive_orders_pdf.core import PDFDownloader, extract_pdf_links, merge_pdfs
-from executive_orders_pdf.utils import (
-    ConfigUtils,
-    FileSystemUtils,
-    PDFUtils,
-    ProgressTracker,
-)
+# Map of re-exported names to the submodules that define them; imports are
+# deferred to first attribute access (PEP 562) so importing the package
+# doesn't pull in pypdf, aiohttp and friends up front
+_EXPORTS = {
+    "cli": "executive_orders_pdf.cli",
+    "PDFDownloader": "executive_orders_pdf.core",
+    "extract_pdf_links": "executive_orders_pdf.core",
+    "merge_pdfs": "executive_orders_pdf.core",
+    "PDFUtils": "executive_orders_pdf.utils",
+    "FileSystemUtils": "executive_orders_pdf.utils",
+    "ConfigUtils": "executive_orders_pdf.utils",
+    "ProgressTracker": "executive_orders_pdf.utils",
+}
 
 __all__ = [
     "cli",
@@ -21,3 +29,20 @@ __all__ = [
     "ConfigUtils",
     "ProgressTracker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported names lazily on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported names in dir(executive_orders_pdf)."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,50 +1,221 @@
 """Command-line interface for the executive-orders-pdf downloader."""
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
 import click
-import yaml
-from fake_useragent import UserAgent
-from rich.traceback import install
 
-from executive_orders_pdf.core import PDFDownloader, extract_pdf_links, merge_pdfs
 from executive_orders_pdf.utils import FileSystemUtils, console
 
-# Enable Rich traceback for better error handling
-install()
+# Heavy dependencies (yaml, fake_useragent, pypdf via core) are imported
+# lazily inside the functions that need them so `--help` and error paths
+# don't pay their import cost.
+
+# Directory for cached, pre-parsed config files (keyed by source file stat)
+_CONFIG_CACHE_DIR = Path.home() / ".cache" / "executive-orders-pdf"
+
+# In-process memo over the same stat key; repeat load_config calls within
+# one run then skip even the sidecar read
+_CONFIG_MEMO: dict[tuple, Any] = {}
+_CONFIG_MEMO_MAX = 8
+
+# Template for auto-generated Federal Register listing URLs
+_EO_URL_TEMPLATE = "{base_url}/{president}/{year}"
+
+# Built-in defaults, constructed once at import; load_config hands out
+# per-call copies so callers can merge and mutate freely
+_DEFAULT_CONFIG: dict[str, dict[str, Any]] = {
+    "download": {
+        "concurrent_downloads": 5,
+        "retry_attempts": 3,
+    },
+    "output": {
+        "default_filename": "executive_orders.pdf",
+        "download_dir": "downloaded_pdfs",
+    },
+    "url": {
+        "base_url": "https://www.federalregister.gov/presidential-documents/executive-orders",  # noqa: E501
+        "president": "donald-trump",
+        "year": "2025",
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_user_agent() -> Any:
+    """Build the UserAgent instance once; construction parses a large dataset."""
+    from fake_useragent import UserAgent
+
+    return UserAgent()
+
+
+def _remember_config(cache_key: tuple, config: Any) -> None:
+    """Store a parsed config in the in-process memo, bounded in size."""
+    if len(_CONFIG_MEMO) >= _CONFIG_MEMO_MAX:
+        _CONFIG_MEMO.clear()
+    _CONFIG_MEMO[cache_key] = config
+
+
+def _load_config_cached(config_file: str) -> Any:
+    """
+    Load a YAML or JSON config file, using a stat-keyed JSON sidecar cache.
+
+    Parsing YAML is much slower than re-reading plain JSON, so the parsed
+    result is cached under ~/.cache/executive-orders-pdf keyed by the file's
+    path, mtime and size. The cache is skipped entirely if the file cannot
+    be stat'd, and invalidated automatically when the file changes. ``.json``
+    configs are parsed with orjson when it is installed. Within one process,
+    results are additionally memoized in memory under the same stat key.
+
+    Args:
+        config_file: Path to the YAML or JSON config file
+
+    Returns:
+        Parsed config data (usually a dict)
+    """
+    try:
+        stats = os.stat(config_file)
+        cache_key = (str(Path(config_file).resolve()), stats.st_mtime_ns, stats.st_size)
+    except OSError:
+        cache_key = None
+
+    if cache_key in _CONFIG_MEMO:
+        return _CONFIG_MEMO[cache_key]
+
+    cache_path = None
+    if cache_key:
+        # The digest only spreads cache filenames, so sha1 is fine here
+        digest = hashlib.sha1(
+            cache_key[0].encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+        cache_path = _CONFIG_CACHE_DIR / f"{digest}.json"
+        # A missing or stale cache entry falls through to a full parse
+        with contextlib.suppress(OSError, ValueError, TypeError):
+            with open(cache_path, encoding="utf-8") as f:
+                cached_key, cached_config = json.load(f)
+            if cached_key == list(cache_key):
+                _remember_config(cache_key, cached_config)
+                return cached_config
+
+    if config_file.endswith(".json"):
+        # JSON configs skip YAML entirely; orjson is a fast optional extra
+        try:
+            from orjson import loads as _json_loads
+        except ImportError:
+            from json import loads as _json_loads  # type: ignore[assignment]
+
+        with open(config_file, "rb") as f:
+            user_config = _json_loads(f.read())
+    else:
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it; the
+        # pure Python loader is an order of magnitude slower for the same result
+        try:
+            from yaml import CSafeLoader as _YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+        with open(config_file) as f:
+            # _YamlLoader is always a SafeLoader variant; bandit can't see
+            # through the import alias
+            user_config = yaml.load(f, Loader=_YamlLoader)  # nosec B506
+
+    if cache_path is not None:
+        # Caching is best-effort; a read-only home directory or a config
+        # holding non-JSON values (e.g. YAML timestamps) just skips it
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            payload = json.dumps([cache_key, user_config])
+            _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_CONFIG_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)  # Atomic on POSIX
+
+    if cache_key is not None:
+        _remember_config(cache_key, user_config)
+    return user_config
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Validated application configuration with typed fields."""
+
+    concurrent_downloads: int
+    retry_attempts: int
+    default_filename: str
+    download_dir: str
+    base_url: str
+    president: str
+    year: str
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "AppConfig":
+        """
+        Build an AppConfig from a nested config dict, failing fast on bad values.
+
+        Missing keys fall back to the built-in defaults; values of the wrong
+        type raise immediately instead of surfacing deep in the pipeline.
+
+        Args:
+            config: Nested configuration dictionary as returned by load_config
+
+        Raises:
+            click.BadParameter: If a config value has an invalid type
+        """
+        download = config.get("download", {})
+        output = config.get("output", {})
+        url = config.get("url", {})
+        try:
+            return cls(
+                concurrent_downloads=int(download.get("concurrent_downloads", 5)),
+                retry_attempts=int(download.get("retry_attempts", 3)),
+                default_filename=str(
+                    output.get("default_filename", "executive_orders.pdf")
+                ),
+                download_dir=str(output.get("download_dir", "downloaded_pdfs")),
+                base_url=str(
+                    url.get(
+                        "base_url",
+                        "https://www.federalregister.gov/presidential-documents/executive-orders",  # noqa: E501
+                    )
+                ),
+                president=str(url.get("president", "donald-trump")),
+                year=str(url.get("year", "2025")),
+            )
+        except (TypeError, ValueError, AttributeError) as e:
+            raise click.BadParameter(f"Invalid configuration value: {e}") from e
 
 
 def load_config(config_file: Optional[str] = None) -> dict[str, Any]:
     """Load configuration from a YAML file."""
-    default_config: dict[str, dict[str, Any]] = {
-        "download": {
-            "concurrent_downloads": 5,
-            "retry_attempts": 3,
-        },
-        "output": {
-            "default_filename": "executive_orders.pdf",
-            "download_dir": "downloaded_pdfs",
-        },
-        "url": {
-            "base_url": "https://www.federalregister.gov/presidential-documents/executive-orders",  # noqa: E501
-            "president": "donald-trump",
-            "year": "2025",
-        },
+    # Section-deep copy of the shared defaults; cheaper than rebuilding the
+    # nested literals on every call
+    default_config = {
+        section: dict(values) for section, values in _DEFAULT_CONFIG.items()
     }
 
     if config_file and Path(config_file).exists():
         try:
-            with open(config_file) as f:
-                user_config = yaml.safe_load(f)
-                if user_config:
-                    # Deep merge user config with default config
-                    for section, values in user_config.items():
-                        if section in default_config:
-                            default_config[section].update(values)
-                        else:
-                            default_config[section] = values
+            user_config = _load_config_cached(config_file)
+            if user_config:
+                # Merge user sections over defaults with dict union
+                default_config = default_config | {
+                    section: (
+                        default_config.get(section, {}) | values
+                        if isinstance(values, dict)
+                        else values
+                    )
+                    for section, values in user_config.items()
+                }
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to load config file: {e}[/yellow]")
 
@@ -61,6 +232,17 @@ def load_config(config_file: Optional[str] = None) -> dict[str, Any]:
 @click.option("--config", "-f", help="Path to configuration file", default=None)
 @click.option("--president", "-p", help="President name (e.g., donald-trump)")
 @click.option("--year", "-y", help="Year to download executive orders for")
+@click.option(
+    "--compress",
+    is_flag=True,
+    help="Compress page content streams in the merged PDF (slower, smaller)",
+)
+@click.option(
+    "--max-failures",
+    type=int,
+    default=None,
+    help="Abort remaining downloads after this many failures",
+)
 def cli(
     html_file: Optional[str] = None,
     output: Optional[str] = None,
@@ -69,20 +251,27 @@ def cli(
     config: Optional[str] = None,
     president: Optional[str] = None,
     year: Optional[str] = None,
+    compress: bool = False,
+    max_failures: Optional[int] = None,
 ) -> None:
     """First checks for missing PDFs and downloads them, then merges all PDFs."""
-    # Load configuration
-    app_config = load_config(config)
+    from rich.traceback import install
+
+    # Enable Rich traceback for better error handling
+    install()
+
+    # Load and validate configuration once, up front
+    app_config = AppConfig.from_dict(load_config(config))
 
     # Set download directory if not provided
     if not download_dir:
-        download_dir = app_config["output"]["download_dir"]
+        download_dir = app_config.download_dir
     download_path = Path(download_dir)
     FileSystemUtils.ensure_directory(download_path)
 
     # Set output filename if not provided
     if not output:
-        output = app_config["output"]["default_filename"]
+        output = app_config.default_filename
         # If using auto-generated URL, create a more descriptive filename
         if president and year:
             output = f"{president}_executive_orders_{year}.pdf"
@@ -92,60 +281,213 @@ def cli(
     # Construct URL if not provided directly
     if not html_file:
         if not president:
-            president = app_config["url"]["president"]
+            president = app_config.president
         if not year:
-            year = app_config["url"]["year"]
+            year = app_config.year
 
-        base_url = app_config["url"]["base_url"]
-        html_file = f"{base_url}/{president}/{year}"
+        html_file = _EO_URL_TEMPLATE.format(
+            base_url=app_config.base_url, president=president, year=year
+        )
 
     # Set concurrent downloads if not provided
     if not concurrent_downloads:
-        concurrent_downloads = app_config["download"]["concurrent_downloads"]
+        concurrent_downloads = app_config.concurrent_downloads
+
+    # Use uvloop's C event loop when installed; the download pipeline is
+    # scheduling-heavy and benefits directly
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
 
     # Run the download function if needed, then merge
     asyncio.run(
-        download_and_merge(html_file, output_path, download_path, concurrent_downloads)
+        download_and_merge(
+            html_file,
+            output_path,
+            download_path,
+            concurrent_downloads,
+            compress=compress,
+            max_failures=max_failures,
+        )
     )
 
 
+def _doc_number_key(path: Path) -> tuple[Any, ...]:
+    """
+    Sort key ordering PDFs by Federal Register document number, newest first.
+
+    Filenames follow the YYYY-NNNNN.pdf format; anything that doesn't parse
+    sorts after the numbered documents, by name.
+
+    Args:
+        path: Path to a PDF file
+
+    Returns:
+        Tuple usable as a sorted() key
+    """
+    parts = path.stem.split("-")
+    try:
+        return (0, -int(parts[0]), -int(parts[1]))
+    except (IndexError, ValueError):
+        return (1, path.name)
+
+
+def _list_pdfs(download_dir: Path) -> list[Path]:
+    """Scan the download directory once and return its PDFs, newest first."""
+    with os.scandir(download_dir) as entries:
+        return sorted(
+            (
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file()
+            ),
+            key=_doc_number_key,
+        )
+
+
+def _merge_meta_path(output: Path) -> Path:
+    """Sidecar recording the settings the merged output was built with."""
+    return output.with_name(f".{output.name}.merge.json")
+
+
+def _output_was_compressed(output: Path) -> bool:
+    """Read the compress flag from the merge sidecar; absent means False."""
+    try:
+        with open(_merge_meta_path(output), encoding="utf-8") as f:
+            return bool(json.load(f).get("compress_streams", False))
+    except (OSError, ValueError):
+        return False
+
+
+def _record_merge_settings(output: Path, compress: bool) -> None:
+    """Persist the merge settings sidecar, best-effort."""
+    try:
+        with open(_merge_meta_path(output), "w", encoding="utf-8") as f:
+            json.dump({"compress_streams": compress}, f)
+    except OSError:
+        pass
+
+
+def _output_is_current(output: Path, pdf_files: list[Path], compress: bool) -> bool:
+    """
+    Check whether the merged output is already newer than every source PDF.
+
+    Args:
+        output: Path to the merged output PDF
+        pdf_files: Source PDFs that would be merged
+        compress: Whether the caller wants compressed content streams; an
+            output built with different compression is never current
+
+    Returns:
+        True if the output exists, was built with the requested compression
+        setting, and no source PDF is newer than it
+    """
+    try:
+        output_mtime = output.stat().st_mtime
+        if not all(pdf.stat().st_mtime <= output_mtime for pdf in pdf_files):
+            return False
+    except OSError:
+        return False
+    return _output_was_compressed(output) == compress
+
+
+async def _prefetch_pdf_info(
+    completed: "asyncio.Queue[Optional[Path]]", info_cache: dict[Path, Any]
+) -> None:
+    """
+    Extract merge metadata for each downloaded PDF as it finishes.
+
+    Runs concurrently with the downloads so the per-PDF parsing cost
+    overlaps network I/O instead of being paid serially before the merge.
+    A None item on the queue signals that downloads are done.
+
+    Args:
+        completed: Queue of downloaded paths, terminated by None
+        info_cache: Dictionary to fill with _extract_pdf_info results
+    """
+    from executive_orders_pdf.core import _extract_pdf_info
+
+    while True:
+        path = await completed.get()
+        if path is None:
+            break
+        info_cache[path] = await asyncio.to_thread(_extract_pdf_info, path)
+
+
 async def download_and_merge(
-    html_file: str, output: Path, download_dir: Path, concurrent_downloads: int
+    html_file: str,
+    output: Path,
+    download_dir: Path,
+    concurrent_downloads: int,
+    compress: bool = False,
+    max_failures: Optional[int] = None,
 ) -> None:
     """Download any missing PDFs and then merge all existing PDFs."""
+    from executive_orders_pdf.core import (
+        PDFDownloader,
+        create_session,
+        extract_pdf_links,
+        merge_pdfs,
+    )
+
     console.rule("[bold blue]Federal Register PDF Downloader & Merger")
 
-    # Setup for extraction
-    ua = UserAgent()
-    headers = {"User-Agent": ua.random}
-
-    # Extract PDF links
-    pdf_links = await extract_pdf_links(html_file, headers)
-    if not pdf_links:
-        console.print("[yellow]No PDF links found to download[/yellow]")
-        # Even if no links found, still try to merge existing PDFs
-        existing_pdfs = set(download_dir.glob("*.pdf"))
-        if existing_pdfs:
-            console.print(f"[green]Found {len(existing_pdfs)} existing PDFs[/green]")
-            console.print(f"[bold]Merging PDFs into: {output}[/bold]")
-            merge_pdfs(existing_pdfs, output)
-            console.print(f"[green]✔ Merged PDF saved as: {output}[/green]")
-        else:
-            console.print("[red]No PDFs found to merge[/red]")
-        return
+    # Setup for extraction; one session serves both the listing fetch and
+    # the downloads so connections and DNS entries stay warm across phases
+    headers = {"User-Agent": _get_user_agent().random}
+    session = create_session(headers)
 
-    console.print(f"[green]Found {len(pdf_links)} PDF links[/green]")
+    info_cache: dict[Path, Any] = {}
+    try:
+        pdf_links = await extract_pdf_links(html_file, headers, session=session)
+        if not pdf_links:
+            console.print("[yellow]No PDF links found to download[/yellow]")
+        else:
+            console.print(f"[green]Found {len(pdf_links)} PDF links[/green]")
 
-    # Setup downloader with progress bar
-    downloader = PDFDownloader(download_dir, concurrent_downloads)
-    await downloader.download_all(pdf_links)
+            # Setup downloader with progress bar, and overlap per-PDF metadata
+            # extraction with the downloads via a producer/consumer queue
+            downloader = PDFDownloader(download_dir, concurrent_downloads)
+            completed: "asyncio.Queue[Optional[Path]]" = asyncio.Queue()
+            prefetch_task = asyncio.create_task(
+                _prefetch_pdf_info(completed, info_cache)
+            )
+            try:
+                await downloader.download_all(
+                    pdf_links,
+                    completed=completed,
+                    max_failures=max_failures,
+                    session=session,
+                )
+            finally:
+                await completed.put(None)
+                await prefetch_task
+    finally:
+        await session.close()
 
-    # Get all PDFs in the download directory, regardless of whether they were just downloaded
-    all_pdfs = set(download_dir.glob("*.pdf"))
+    # Scan the directory once after downloads complete; this picks up both
+    # freshly downloaded and pre-existing PDFs
+    all_pdfs = _list_pdfs(download_dir)
     if all_pdfs:
         console.print(f"[green]Found {len(all_pdfs)} PDFs in total[/green]")
+        if _output_is_current(output, all_pdfs, compress):
+            console.print(
+                f"[green]✔ {output} is already up to date, skipping merge[/green]"
+            )
+            return
         console.print(f"[bold]Merging PDFs into: {output}[/bold]")
-        merge_pdfs(all_pdfs, output)
+        # Merging is CPU/disk bound; keep it off the event loop
+        await asyncio.to_thread(
+            merge_pdfs,
+            all_pdfs,
+            output,
+            info_cache=info_cache,
+            compress_streams=compress,
+        )
+        _record_merge_settings(output, compress)
         console.print(f"[green]✔ Merged PDF saved as: {output}[/green]")
     else:
         console.print("[red]No PDFs found to merge[/red]")
@@ -1,17 +1,40 @@
 """Core functionality for downloading and merging PDFs from the Federal Register."""
 
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import json
+import logging
+import os
 import re
+import tempfile
+from collections.abc import Iterable
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
+from typing import Optional, Union
 
-import aiofiles
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from fake_useragent import UserAgent
 from pypdf import PdfReader, PdfWriter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# Optional C-backed text extraction; an order of magnitude faster than
+# pypdf's extract_text when installed
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None  # type: ignore[assignment]
+
+# Optional C-backed HTML parsing for link extraction; BeautifulSoup with
+# html.parser stays as the pure-Python fallback
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None  # type: ignore[assignment, misc]
+
 from executive_orders_pdf.utils import (
     FileSystemUtils,
     PDFUtils,
@@ -19,29 +42,207 @@ from executive_orders_pdf.utils import (
     console,
 )
 
+# Size of the network read buffer and of each streamed write to disk;
+# 64KiB keeps syscall counts low without holding much of a PDF in memory
+_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _default_user_agent() -> str:
+    """
+    Pick a randomized User-Agent once per process.
+
+    UserAgent() loads a sizeable browser dataset, and re-randomizing the
+    header per request defeats keep-alive on servers that key connections
+    on it; one stable value per run avoids both costs.
+    """
+    return UserAgent().random
+
+
+def create_session(headers: Optional[dict] = None) -> aiohttp.ClientSession:
+    """
+    Build a ClientSession tuned for bulk PDF fetching.
+
+    A single session shared between link extraction and the downloads keeps
+    DNS lookups and TLS connections warm instead of re-handshaking per
+    phase. Admission control stays with the downloader's slot counter, so
+    the connector itself is left uncapped.
+
+    Args:
+        headers: Default headers for every request, e.g. the User-Agent
+
+    Returns:
+        A new aiohttp.ClientSession; the caller is responsible for closing it
+    """
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=connector,
+        read_bufsize=_CHUNK_SIZE,
+        timeout=aiohttp.ClientTimeout(total=None, sock_read=30),
+    )
+
 
 class PDFDownloader:
     """Downloads PDFs concurrently with rate limiting and progress tracking."""
 
-    def __init__(self, download_dir: Path, concurrent_downloads: int = 5):
+    def __init__(
+        self,
+        download_dir: Path,
+        concurrent_downloads: int = 5,
+        check_remote: bool = False,
+        verbose: bool = True,
+    ):
         """
         Initialize the PDF downloader.
 
         Args:
             download_dir: Directory to save downloaded PDFs
             concurrent_downloads: Maximum number of concurrent downloads
+            check_remote: If True, probe existing files with a conditional
+                HEAD request and re-download them when the remote is newer
+            verbose: If False, route per-file progress chatter through the
+                debug logger instead of rich, keeping its markup parser out
+                of the download hot path
         """
         self.download_dir = Path(download_dir)
         FileSystemUtils.ensure_directory(self.download_dir)
         self.concurrent_downloads = concurrent_downloads
-        self.semaphore = asyncio.Semaphore(concurrent_downloads)
-        self.ua = UserAgent()
-        self.downloaded_files: set[Path] = set()
+        self.check_remote = check_remote
+        self.verbose = verbose
+        self._log = console.print if verbose else logging.getLogger(__name__).debug
+        # A Condition-guarded counter instead of a Semaphore so the limit can
+        # be resized safely while downloads are in flight
+        self._condition = asyncio.Condition()
+        self._active_downloads = 0
+        # Stored as strings: str hashing is a flat byte hash, where
+        # hashing a fresh Path re-stringifies and case-normalizes it
+        self.downloaded_files: set[str] = set()
         self.failed_downloads: set[str] = set()
-        console.print(
+        # Sidecar manifest of already-verified files, keyed by filename with
+        # (size, mtime_ns) values; lets re-runs skip opening unchanged PDFs
+        self._manifest_path = self.download_dir / ".verified.json"
+        self._manifest = self._load_manifest()
+        self._manifest_dirty = False
+        self._log(
             f"[blue]Initialized PDFDownloader with {concurrent_downloads} concurrent downloads[/blue]"
         )
 
+    @property
+    def ua_string(self) -> str:
+        """User-Agent header value, shared process-wide and built lazily."""
+        return _default_user_agent()
+
+    def _load_manifest(self) -> dict[str, list[int]]:
+        """Read the verification manifest; any problem yields an empty one."""
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Persist the verification manifest if anything changed."""
+        if not self._manifest_dirty:
+            return
+        try:
+            with open(self._manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f)
+            self._manifest_dirty = False
+        except OSError:
+            # Best-effort; a read-only download directory just re-verifies
+            pass
+
+    def _is_verified(self, path: Path, stats: Optional[os.stat_result]) -> bool:
+        """Check whether a file matches its manifest entry, if any."""
+        if stats is None:
+            return False
+        return self._manifest.get(path.name) == [stats.st_size, stats.st_mtime_ns]
+
+    def _record_verified(
+        self, path: Path, stats: Optional[os.stat_result] = None
+    ) -> None:
+        """Record a file as verified under its current size and mtime."""
+        if stats is None:
+            try:
+                stats = os.stat(path)
+            except OSError:
+                return
+        self._manifest[path.name] = [stats.st_size, stats.st_mtime_ns]
+        self._manifest_dirty = True
+
+    async def set_concurrency(self, concurrent_downloads: int) -> None:
+        """
+        Adjust the maximum number of concurrent downloads at runtime.
+
+        Useful for backing off when the server starts returning 429s.
+        In-flight downloads are unaffected. Lowering the limit takes effect
+        immediately: waiters at the slot gate re-check it before starting.
+        Raising it mid-batch cannot add parallelism, because download_all
+        sizes its worker pool from the limit up front; increases apply from
+        the next batch onwards.
+
+        Args:
+            concurrent_downloads: New maximum number of concurrent downloads
+        """
+        async with self._condition:
+            self.concurrent_downloads = concurrent_downloads
+            self._condition.notify_all()
+        self._log(f"[blue]Concurrency limit set to {concurrent_downloads}[/blue]")
+
+    async def _acquire_slot(self) -> None:
+        """Wait until a download slot is available and claim it."""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._active_downloads < self.concurrent_downloads
+            )
+            self._active_downloads += 1
+
+    async def _release_slot(self) -> None:
+        """Release a download slot and wake one waiter."""
+        async with self._condition:
+            self._active_downloads -= 1
+            self._condition.notify(1)
+
+    async def _remote_is_newer(
+        self, session: aiohttp.ClientSession, url: str, local_filename: Path
+    ) -> bool:
+        """
+        Probe the remote file with a conditional HEAD request.
+
+        Args:
+            session: aiohttp client session
+            url: URL of the remote PDF
+            local_filename: Path to the local copy
+
+        Returns:
+            True only if the server reports a Last-Modified newer than the
+            local file; any error or missing header keeps the local copy
+        """
+        local_mtime = local_filename.stat().st_mtime
+        headers = {"If-Modified-Since": formatdate(local_mtime, usegmt=True)}
+        try:
+            async with session.head(
+                url, headers=headers, allow_redirects=True
+            ) as response:
+                if response.status == 304:
+                    return False
+                last_modified = response.headers.get("Last-Modified")
+                if not last_modified:
+                    return False
+                return parsedate_to_datetime(last_modified).timestamp() > local_mtime
+        except Exception as e:
+            self._log(
+                f"[yellow]HEAD check failed for {url}, keeping local copy: {str(e)}[/yellow]"
+            )
+            return False
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -61,78 +262,249 @@ class PDFDownloader:
         Raises:
             Exception: If download fails after retries or PDF is invalid
         """
-        local_filename = self.download_dir / Path(url).name
+        # Plain string slicing; Path(url) would parse and normalize the
+        # whole URL just to take its basename
+        local_filename = self.download_dir / url.rpartition("/")[2].partition("?")[0]
+        # In-progress downloads stream to a .part file and are renamed into
+        # place only once complete
+        part_path = local_filename.with_name(local_filename.name + ".part")
         start_time = datetime.now()
+        resume_from = 0
+        last_modified: Optional[str] = None
 
+        # One stat covers the existence, non-empty and manifest checks
+        local_stats: Optional[os.stat_result]
         try:
-            if local_filename.exists() and local_filename.stat().st_size > 0:
-                if PDFUtils.verify_pdf(local_filename):
-                    console.print(
-                        f"[yellow]Using existing valid file: {local_filename}[/yellow]"
+            local_stats = os.stat(local_filename)
+            have_existing = local_stats.st_size > 0
+        except OSError:
+            local_stats = None
+            have_existing = False
+
+        try:
+            if have_existing:
+                # An unchanged manifest entry means the file was verified on
+                # a previous run; skip opening it again
+                if self._is_verified(local_filename, local_stats):
+                    verified = True
+                else:
+                    # Off the event loop: the read would otherwise stall
+                    # every other in-flight download
+                    verified = await asyncio.to_thread(
+                        PDFUtils.verify_pdf, local_filename
                     )
-                    self.downloaded_files.add(local_filename)
-                    return local_filename
+                    if verified:
+                        self._record_verified(local_filename, local_stats)
+                if verified:
+                    if not self.check_remote or not await self._remote_is_newer(
+                        session, url, local_filename
+                    ):
+                        self._log(
+                            f"[yellow]Using existing valid file: {local_filename}[/yellow]"
+                        )
+                        self.downloaded_files.add(str(local_filename))
+                        return local_filename
+                    self._log(f"[yellow]Remote {url} is newer, re-downloading[/yellow]")
+                    local_filename.unlink()
                 else:
-                    console.print(
+                    self._log(
                         f"[yellow]Existing file {local_filename} is invalid, re-downloading[/yellow]"
                     )
                     local_filename.unlink()
 
-            async with self.semaphore:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    async with aiofiles.open(local_filename, "wb") as f:
-                        content = await response.read()
-                        await f.write(content)
+            # A leftover .part file from an interrupted run can be resumed
+            # with a Range request instead of re-fetching from byte zero
+            try:
+                part_stats: Optional[os.stat_result] = os.stat(part_path)
+            except OSError:
+                part_stats = None
+            resume_from = part_stats.st_size if part_stats else 0
+            part_mtime = part_stats.st_mtime if part_stats else 0.0
 
-                    if not PDFUtils.verify_pdf(local_filename):
-                        raise ValueError(
-                            f"Downloaded PDF {local_filename} failed verification"
-                        )
+            await self._acquire_slot()
+            try:
+                while True:
+                    if resume_from:
+                        # If-Range carries the .part mtime, stamped from the
+                        # server's Last-Modified when the prefix was kept; a
+                        # remote that changed since then fails the validator
+                        # and comes back as a full 200 body instead of
+                        # splicing two file versions together
+                        range_headers: Optional[dict[str, str]] = {
+                            "Range": f"bytes={resume_from}-",
+                            "If-Range": formatdate(part_mtime, usegmt=True),
+                        }
+                    else:
+                        range_headers = None
+                    async with session.get(url, headers=range_headers) as response:
+                        if resume_from and response.status == 416:
+                            # The prefix already covers (or overshoots) the
+                            # remote body, so it can't be trusted; drop it
+                            # and refetch from byte zero rather than failing
+                            # this and every future attempt with 416
+                            self._log(
+                                f"[yellow]Resume of {url} rejected (416), "
+                                f"restarting from scratch[/yellow]"
+                            )
+                            part_path.unlink(missing_ok=True)
+                            resume_from = 0
+                            continue
+                        response.raise_for_status()
+                        last_modified = response.headers.get("Last-Modified")
+                        if resume_from and response.status == 206:
+                            self._log(
+                                f"[yellow]Resuming {url} from byte {resume_from}[/yellow]"
+                            )
+                            mode = "ab"
+                            bytes_written = resume_from
+                        else:
+                            # Fresh body (or the server ignored the Range
+                            # header); truncate and start over
+                            mode = "wb"
+                            bytes_written = 0
+                        # Stream to disk in chunks; buffering the whole body in
+                        # memory costs O(filesize) per in-flight download. Plain
+                        # buffered writes land in the page cache in microseconds,
+                        # whereas aiofiles paid two thread hops per chunk
+                        with open(part_path, mode) as f:
+                            async for chunk in response.content.iter_chunked(
+                                _CHUNK_SIZE
+                            ):
+                                f.write(chunk)
+                                bytes_written += len(chunk)
+                    break
+            finally:
+                await self._release_slot()
 
-                    download_time = (datetime.now() - start_time).total_seconds()
-                    size_mb = local_filename.stat().st_size / (1024 * 1024)
-                    console.print(
-                        f"[green]Successfully downloaded {url} "
-                        f"(Size: {size_mb:.2f}MB, Time: {download_time:.2f}s)[/green]"
-                    )
+            # Publish atomically; an interrupted run never leaves a
+            # truncated file under the final .pdf name
+            os.replace(part_path, local_filename)
+
+            # Verify outside the download slot and off the event loop:
+            # parsing spends no remote rate-limit budget and shouldn't
+            # keep the next transfer from starting
+            if not await asyncio.to_thread(PDFUtils.verify_pdf, local_filename):
+                raise ValueError(f"Downloaded PDF {local_filename} failed verification")
+            self._record_verified(local_filename)
 
-                    self.downloaded_files.add(local_filename)
-                    return local_filename
+            download_time = (datetime.now() - start_time).total_seconds()
+            size_mb = bytes_written / (1024 * 1024)
+            self._log(
+                f"[green]Successfully downloaded {url} "
+                f"(Size: {size_mb:.2f}MB, Time: {download_time:.2f}s)[/green]"
+            )
+
+            self.downloaded_files.add(str(local_filename))
+            return local_filename
 
         except Exception as e:
             self.failed_downloads.add(url)
             console.print(f"[red]Error downloading {url}: {str(e)}[/red]")
-            if local_filename.exists():
+            if resume_from:
+                # A resumed attempt that still failed shouldn't poison the
+                # retries: drop the prefix so the next one starts clean
+                part_path.unlink(missing_ok=True)
+            elif last_modified is not None:
+                # Keep the fresh prefix for the next attempt to resume,
+                # stamped with the server's Last-Modified so If-Range can
+                # vouch the remote hasn't changed underneath it
+                with contextlib.suppress(OSError, ValueError, TypeError):
+                    mtime = parsedate_to_datetime(last_modified).timestamp()
+                    os.utime(part_path, (mtime, mtime))
+            # Never leave a possibly-corrupt file under the final name
+            try:
                 local_filename.unlink()
+            except FileNotFoundError:
+                pass
             raise
 
-    async def download_all(self, urls: list[str]) -> list[Path]:
+    async def download_all(
+        self,
+        urls: list[str],
+        completed: Optional[asyncio.Queue] = None,
+        max_failures: Optional[int] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> list[Path]:
         """
         Download multiple PDFs concurrently with enhanced error handling.
 
         Args:
             urls: List of PDF URLs to download
+            completed: Optional queue that receives each downloaded path as
+                soon as it finishes, so callers can pipeline further work
+            max_failures: If set, cancel all remaining downloads once more
+                than this many have failed (e.g. when the server starts
+                rate-limiting the whole batch)
+            session: Optional shared ClientSession; when omitted one is
+                created for the batch and closed afterwards
 
         Returns:
             List of paths to the downloaded files
         """
-        console.print(f"[blue]Starting download of {len(urls)} PDFs[/blue]")
-        headers = {"User-Agent": self.ua.random}
-
-        with ProgressTracker(len(urls), "Downloading PDFs"):
-            async with aiohttp.ClientSession(headers=headers) as session:
-                tasks = [self.download_file(session, url) for url in urls]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results and log failures
-        successful_downloads = []
-        for url, result in zip(urls, results):
-            if isinstance(result, Exception):
-                console.print(f"[red]Failed to download {url}: {str(result)}[/red]")
-                self.failed_downloads.add(url)
-            else:
-                successful_downloads.append(result)
+        self._log(f"[blue]Starting download of {len(urls)} PDFs[/blue]")
+
+        # Reuse the caller's session when given (it already carries warm
+        # connections from link extraction); otherwise build one for this
+        # batch. The Condition-guarded slot counter stays in charge of
+        # admission so the limit can still be resized mid-run
+        owns_session = session is None
+        client: aiohttp.ClientSession = (
+            session
+            if session is not None
+            else create_session({"User-Agent": self.ua_string})
+        )
+
+        async def download_one(url: str) -> Path:
+            path = await self.download_file(client, url)
+            if completed is not None:
+                await completed.put(path)
+            return path
+
+        # A fixed worker pool pulling from a queue never materializes more
+        # than one task per worker, unlike fanning out len(urls) coroutines
+        # up front; the slot counter stays authoritative for admission
+        url_queue: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            url_queue.put_nowait(url)
+
+        successful_downloads: list[Path] = []
+        failures = 0
+        abort = False
+
+        async def worker(progress: ProgressTracker) -> None:
+            nonlocal failures, abort
+            while not abort:
+                try:
+                    url = url_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    successful_downloads.append(await download_one(url))
+                except Exception:
+                    # download_file already logged and recorded the URL
+                    failures += 1
+                    if max_failures is not None and failures > max_failures:
+                        # Stop every worker after its current item instead
+                        # of burning retries against a struggling server
+                        abort = True
+                        console.print(
+                            f"[red]{failures} downloads failed "
+                            f"(limit {max_failures}); cancelling the rest[/red]"
+                        )
+                progress.update()
+
+        try:
+            with ProgressTracker(len(urls), "Downloading PDFs") as progress:
+                workers = [
+                    asyncio.create_task(worker(progress))
+                    for _ in range(min(len(urls), max(self.concurrent_downloads, 1)))
+                ]
+                await asyncio.gather(*workers)
+        finally:
+            if owns_session:
+                await client.close()
+
+        self._save_manifest()
 
         console.print(
             f"[blue]Download complete. [green]Successful: {len(successful_downloads)}[/green], "
@@ -146,189 +518,502 @@ class PDFDownloader:
         return successful_downloads
 
 
-async def extract_pdf_links(html_file: str, headers: dict) -> list[str]:
+async def extract_pdf_links(
+    html_file: str,
+    headers: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> list[str]:
     """
     Extract PDF links from an HTML file or URL.
 
     Args:
         html_file: Path to local HTML file or URL
-        headers: HTTP headers for requests
+        headers: HTTP headers for requests (ignored when a session carrying
+            its own default headers is supplied)
+        session: Optional shared ClientSession, reused so the connections it
+            opens here stay warm for the downloads that follow
 
     Returns:
         List of PDF URLs
     """
+    content: Union[str, bytes]
     if html_file.startswith("http"):
-        async with aiohttp.ClientSession(headers=headers) as session:
+        # Hand the raw bytes to the HTML parser; response.text() would run
+        # charset detection and a full decode only for the parser to
+        # re-examine the encoding anyway
+        if session is not None:
             async with session.get(html_file) as response:
-                content = await response.text()
+                content = await response.read()
+        else:
+            async with aiohttp.ClientSession(headers=headers) as one_off:
+                async with one_off.get(html_file) as response:
+                    content = await response.read()
     else:
-        with open(html_file, encoding="utf-8") as f:
-            content = f.read()
+        # Off the event loop, same as PDF verification: a slow disk read
+        # here would stall every other coroutine. aiofiles would add a
+        # dependency to do the same single-read offload
+        content = await asyncio.to_thread(Path(html_file).read_text, encoding="utf-8")
+        # Local files are almost always saved Federal Register listings
+        # whose PDF hrefs are absolute govinfo URLs; a flat regex scan
+        # finds them without building a DOM. Pages the scan comes up
+        # empty on (e.g. relative hrefs) fall through to the parsers.
+        links = list(dict.fromkeys(_GOVINFO_PDF_URL_RE.findall(content)))
+        if links:
+            return links
 
-    soup = BeautifulSoup(content, "html.parser")
-    return [
-        link["href"]
-        for link in soup.find_all("a", href=True)
-        if link["href"].endswith(".pdf") and "govinfo.gov" in link["href"]
-    ]
+    return _extract_links_from_html(content)
 
 
-def merge_pdfs(pdf_files: set[Path], output: Path) -> None:
+def _extract_links_from_html(content: Union[str, bytes]) -> list[str]:
     """
-    Merge multiple PDFs into a single file with deterministic output.
-    PDFs are sorted by Federal Register document number in descending order (newest first).
-    Only includes executive orders from January 20th, 2025 onwards.
+    Pull govinfo PDF hrefs out of Federal Register listing HTML.
+
+    Uses selectolax when installed; listing pages carry thousands of
+    anchors and the C parser is an order of magnitude faster than
+    html.parser.
+
+    Args:
+        content: HTML document text or raw bytes (both parsers sniff the
+            encoding themselves)
+
+    Returns:
+        List of PDF URLs
+    """
+    if _SelectolaxParser is not None:
+        return [
+            href
+            for node in _SelectolaxParser(content).css("a[href]")
+            if (href := node.attributes.get("href") or "").endswith(".pdf")
+            and "govinfo.gov" in href
+        ]
+
+    # Within the BeautifulSoup fallback, prefer the C-backed lxml builder
+    # over the pure-Python html.parser when it happens to be installed
+    try:
+        soup = BeautifulSoup(content, "lxml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(content, "html.parser")
+    return [link["href"] for link in soup.find_all("a", href=_PDF_HREF_RE)]
+
+
+# Above this many input files, merge through temporary batch PDFs so each
+# batch's objects can be compressed and released before the final pass
+_MERGE_BATCH_SIZE = 200
+
+# Minimum number of uncached PDFs before the extraction pass is worth
+# fanning out across processes; spawning workers costs more below this
+_PARALLEL_EXTRACT_MIN = 8
+
+# During a merge, collapse identical objects after every this many source
+# files so the in-memory object graph stays bounded instead of deflating
+# once at its peak size
+_COMPRESS_EVERY = 50
+
+# Sidecar file caching _extract_pdf_info results across runs, keyed per
+# filename by (size, mtime_ns); re-runs then skip first-page text extraction
+# for unchanged files entirely
+_INFO_SIDECAR_NAME = ".pdf_info.json"
+
+# Buffer size for writing merged PDFs; pypdf serializes in many small
+# writes, so a 1MiB buffer batches them into far fewer syscalls than the
+# default 8KiB
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _load_info_sidecar(directory: Path) -> dict:
+    """Read the extraction-info sidecar; any problem yields an empty one."""
+    try:
+        with open(directory / _INFO_SIDECAR_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def _save_info_sidecar(directory: Path, entries: dict) -> None:
+    """Persist the extraction-info sidecar, best-effort."""
+    try:
+        with open(directory / _INFO_SIDECAR_NAME, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except (OSError, TypeError):
+        pass
+
+
+# Date patterns found on Federal Register first pages, compiled once: a
+# written-out 2025 date with an optional "Dated:" prefix, or the hyphenated
+# "Filed d-Month-" stamp
+_MONTHS = (
+    r"(?:January|February|March|April|May|June|July"
+    r"|August|September|October|November|December)"
+)
+_DATE_RE = re.compile(
+    rf"(?:Dated:\s*)?{_MONTHS}\s+\d{{1,2}},\s+2025"
+    rf"|Filed\s+\d{{1,2}}(?:–|-){_MONTHS}(?:–|-)"
+)
+_FILED_RE = re.compile(r"Filed\s+(\d{1,2})(?:–|-)(\w+)(?:–|-)")
+
+# Orders dated before the January 20, 2025 inauguration are excluded from
+# merges; built once rather than per call
+_INAUGURATION_CUTOFF = datetime(2025, 1, 20).date()
+
+# Matches govinfo PDF hrefs; handing this to find_all lets BeautifulSoup
+# filter attribute values internally instead of walking every anchor
+# through a Python-level predicate
+_PDF_HREF_RE = re.compile(r"govinfo\.gov.*\.pdf$")
+
+# Absolute govinfo PDF URLs as they appear in saved listing HTML; used to
+# scan local files without a DOM parse
+_GOVINFO_PDF_URL_RE = re.compile(r"https://www\.govinfo\.gov/[^\s\"'<>]+\.pdf")
+
+
+def _merge_in_batches(
+    sorted_pdf_files: list[tuple[Path, int]], output: Path, compress_streams: bool
+) -> None:
+    """
+    Merge a large set of PDFs through on-disk batch files to bound memory.
+
+    Each batch is merged, compressed and written to a temporary PDF before
+    its writer is released; the final pass then concatenates the much
+    smaller batch outputs.
 
     Args:
-        pdf_files: Set of PDF file paths to merge
+        sorted_pdf_files: (path, document number) pairs in merge order
         output: Output path for the merged PDF
+        compress_streams: If True, also deflate page content streams
     """
-    # Get document info for each PDF
-    pdf_info = []
-    for pdf_path in pdf_files:
-        try:
-            # Extract info from filename (format: YYYY-NNNNN.pdf)
-            doc_num = int(pdf_path.stem.split("-")[1])
+    batch_files: list[Path] = []
+    try:
+        for start in range(0, len(sorted_pdf_files), _MERGE_BATCH_SIZE):
+            batch = sorted_pdf_files[start : start + _MERGE_BATCH_SIZE]
+            batch_merger = PdfWriter()
+            for pdf_path, _doc_num in batch:
+                reader = PDFUtils.get_reader(pdf_path)
+                for page in reader.pages:
+                    batch_merger.add_page(page)
+            batch_merger.compress_identical_objects(
+                remove_identicals=True, remove_orphans=True
+            )
+            fd, tmp_name = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb", _WRITE_BUFFER_SIZE) as batch_file:
+                batch_merger.write(batch_file)
+            batch_merger.close()
+            batch_files.append(Path(tmp_name))
+            console.print(
+                f"[blue]Buffered batch of {len(batch)} PDFs to disk "
+                f"({len(batch_files)} batches so far)[/blue]"
+            )
 
-            # Open PDF to get metadata
-            reader = PdfReader(pdf_path)
+        merger = PdfWriter()
+        for batch_path in batch_files:
+            reader = PdfReader(batch_path)
+            for page in reader.pages:
+                merger.add_page(page)
 
-            # Get the first page text to check document details
-            first_page_text = reader.pages[0].extract_text()
+        if compress_streams:
+            console.print("[blue]Compressing page content streams[/blue]")
+            for page in merger.pages:
+                page.compress_content_streams()
 
-            # Try to get the publication date from the PDF
-            # Look for multiple date patterns
+        merger.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+        merger.metadata = None
+
+        with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as output_file:
+            merger.write(output_file)
+        merger.close()
+        console.print(
+            f"[green]Successfully merged {len(sorted_pdf_files)} PDFs into {output}[/green]"
+        )
+    finally:
+        for batch_path in batch_files:
             try:
-                # Define all possible date patterns
-                date_patterns = [
-                    # Look for "Dated:" field
-                    r"Dated:\s*(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+2025",
-                    # Look for Federal Register publication date
-                    r"(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+2025",
-                    # Look for specific Federal Register format
-                    r"Filed\s+\d{1,2}(?:–|-)(?:January|February|March|April|May|June|July|August|September|October|November|December)(?:–|-)",
-                ]
+                batch_path.unlink()
+            except OSError:
+                pass
 
-                pub_date = None
-                all_dates = []
-
-                # Find all dates in the document
-                for pattern in date_patterns:
-                    matches = re.finditer(pattern, first_page_text)
-                    for match in matches:
-                        date_str = match.group()
-                        try:
-                            if "Filed" in date_str:
-                                # Extract month and day from "Filed" date format
-                                parts = re.search(
-                                    r"Filed\s+(\d{1,2})(?:–|-)(\w+)(?:–|-)", date_str
-                                )
-                                if parts:
-                                    day = parts.group(1)
-                                    month = parts.group(2)
-                                    date_str = f"{month} {day}, 2025"
-                            else:
-                                # Clean up the date string
-                                date_str = date_str.replace("Dated:", "").strip()
-
-                            # Parse the date
-                            date = datetime.strptime(date_str, "%B %d, %Y")
-                            all_dates.append(date)
-                        except (ValueError, AttributeError):
-                            # Skip invalid date formats
-                            console.print(
-                                f"[dim]Skipping invalid date format: {date_str}[/dim]"
-                            )
-                            continue
 
-                # If we found any dates, use the earliest one as the publication date
+def _first_page_text(pdf_path: Path) -> str:
+    """
+    Extract the text of a PDF's first page.
+
+    Uses pypdfium2 when it is installed, which is much faster than pypdf's
+    pure-Python extraction; otherwise falls back to the cached PdfReader.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Text content of the first page
+    """
+    if pdfium is not None:
+        # Any pdfium parse error falls back to pypdf below
+        with contextlib.suppress(Exception):
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                textpage = pdf[0].get_textpage()
+                try:
+                    # pypdfium2 ships no type stubs; pin the return type
+                    return str(textpage.get_text_range())
+                finally:
+                    textpage.close()
+            finally:
+                pdf.close()
+    page = PDFUtils.get_reader(pdf_path).pages[0]
+    # A page that declares resources but no fonts is a scan; extract_text
+    # would decompress its image streams only to return nothing. Inherited
+    # resources come back as None here, in which case we can't tell and
+    # extract as usual
+    resources = page.get("/Resources")
+    if resources is not None:
+        try:
+            has_fonts = bool(resources.get_object().get("/Font"))
+        except Exception:
+            has_fonts = True
+        if not has_fonts:
+            return ""
+    return page.extract_text()
+
+
+def _extract_pdf_info(pdf_path: Path) -> Optional[tuple[Path, int, Optional[datetime]]]:
+    """
+    Extract the document number and publication date for a single PDF.
+
+    The document number comes from the filename (format: YYYY-NNNNN.pdf) and
+    the publication date from the first page text, when one can be found.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Tuple of (path, document number, publication date or None), or None
+        if the PDF could not be parsed at all
+    """
+    try:
+        # Extract info from filename (format: YYYY-NNNNN.pdf)
+        doc_num = int(pdf_path.stem.split("-")[1])
+
+        # Get the first page text to check document details
+        first_page_text = _first_page_text(pdf_path)
+
+        # Try to get the publication date from the PDF
+        # Look for multiple date patterns
+        try:
+            pub_date = None
+            all_dates = []
+
+            # Federal Register headers carry the dates near the top of page
+            # 1, so scan a short prefix first and only fall back to the full
+            # page text when the prefix has no match
+            search_regions = [first_page_text[:2048]]
+            if len(first_page_text) > 2048:
+                search_regions.append(first_page_text)
+
+            for region in search_regions:
+                # Find all dates with a single pass of the precompiled
+                # alternation
+                for match in _DATE_RE.finditer(region):
+                    date_str = match.group()
+                    try:
+                        if "Filed" in date_str:
+                            # Extract month and day from "Filed" date format
+                            parts = _FILED_RE.search(date_str)
+                            if parts:
+                                day = parts.group(1)
+                                month = parts.group(2)
+                                date_str = f"{month} {day}, 2025"
+                        else:
+                            # Clean up the date string
+                            date_str = date_str.replace("Dated:", "").strip()
+
+                        # Parse the date
+                        date = datetime.strptime(date_str, "%B %d, %Y")
+                        all_dates.append(date)
+                    except (ValueError, AttributeError):
+                        # Skip invalid date formats
+                        console.print(
+                            f"[dim]Skipping invalid date format: {date_str}[/dim]"
+                        )
+                        continue
                 if all_dates:
-                    pub_date = min(all_dates)
-                    console.print(
-                        f"[blue]Found date {pub_date.strftime('%B %d, %Y')} for {pdf_path.name}[/blue]"
-                    )
-                else:
-                    console.print(
-                        f"[yellow]Warning: Could not find any dates in {pdf_path.name}, using doc number as proxy[/yellow]"
-                    )
+                    break
 
-            except Exception as e:
+            # If we found any dates, use the earliest one as the publication date
+            if all_dates:
+                pub_date = min(all_dates)
                 console.print(
-                    f"[yellow]Warning: Error parsing date from {pdf_path.name}: {str(e)}[/yellow]"
+                    f"[blue]Found date {pub_date.strftime('%B %d, %Y')} for {pdf_path.name}[/blue]"
                 )
-                pub_date = None
-
-            # Skip if the document is from January 19th or earlier
-            if pub_date and pub_date.date() <= datetime(2025, 1, 19).date():
+            else:
                 console.print(
-                    f"[yellow]Skipping {pdf_path.name} (Doc #{doc_num}, Date: {pub_date.strftime('%B %d, %Y')})[/yellow]"
+                    f"[yellow]Warning: Could not find any dates in {pdf_path.name}, using doc number as proxy[/yellow]"
                 )
-                continue
 
-            pdf_info.append((pdf_path, doc_num, pub_date))
         except Exception as e:
             console.print(
-                f"[yellow]Warning: Could not parse info from {pdf_path.name}, skipping: {str(e)}[/yellow]"
+                f"[yellow]Warning: Error parsing date from {pdf_path.name}: {str(e)}[/yellow]"
             )
+            pub_date = None
+
+        return (pdf_path, doc_num, pub_date)
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: Could not parse info from {pdf_path.name}, skipping: {str(e)}[/yellow]"
+        )
+        return None
+
+
+def merge_pdfs(
+    pdf_files: Iterable[Path],
+    output: Path,
+    info_cache: Optional[
+        dict[Path, Optional[tuple[Path, int, Optional[datetime]]]]
+    ] = None,
+    compress_streams: bool = False,
+) -> None:
+    """
+    Merge multiple PDFs into a single file with deterministic output.
+    PDFs are sorted by Federal Register document number in descending order (newest first).
+    Only includes executive orders from January 20th, 2025 onwards.
+
+    Args:
+        pdf_files: Iterable of PDF file paths to merge
+        output: Output path for the merged PDF
+        info_cache: Optional precomputed results of _extract_pdf_info, keyed
+            by path; lets callers extract info while downloads are in flight
+        compress_streams: If True, also deflate page content streams for a
+            smaller output at the cost of extra CPU time
+    """
+    # Get document info for each PDF, reusing any prefetched results and
+    # the on-disk sidecar from previous runs
+    pdf_files = list(pdf_files)
+    cached = info_cache or {}
+
+    sidecar_dir = pdf_files[0].parent if pdf_files else None
+    sidecar = _load_info_sidecar(sidecar_dir) if sidecar_dir is not None else {}
+    sidecar_hits: dict[Path, tuple[Path, int, Optional[datetime]]] = {}
+    for pdf_path in pdf_files:
+        if pdf_path in cached or pdf_path.parent != sidecar_dir:
+            continue
+        entry = sidecar.get(pdf_path.name)
+        if not entry:
             continue
+        try:
+            stats = pdf_path.stat()
+        except OSError:
+            continue
+        if entry[0] == stats.st_size and entry[1] == stats.st_mtime_ns:
+            pub_date = datetime.fromisoformat(entry[3]) if entry[3] else None
+            sidecar_hits[pdf_path] = (pdf_path, entry[2], pub_date)
 
-    # Sort by document number (descending) and filter by date
-    INAUGURATION_DATE = datetime(2025, 1, 20)
-    sorted_pdf_files = []
+    missing = [p for p in pdf_files if p not in cached and p not in sidecar_hits]
+
+    # Text extraction is CPU-bound and per-file independent, so large
+    # uncached batches are fanned out across processes
+    extracted: dict[Path, Optional[tuple[Path, int, Optional[datetime]]]] = {}
+    if len(missing) >= _PARALLEL_EXTRACT_MIN:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            extracted = dict(zip(missing, executor.map(_extract_pdf_info, missing)))
+    else:
+        extracted = {path: _extract_pdf_info(path) for path in missing}
 
-    # First sort by doc number (descending)
+    pdf_info = []
+    sidecar_dirty = False
+    for pdf_path in pdf_files:
+        if pdf_path in cached:
+            info = cached[pdf_path]
+        elif pdf_path in sidecar_hits:
+            info = sidecar_hits[pdf_path]
+        else:
+            info = extracted[pdf_path]
+        if info is not None:
+            pdf_info.append(info)
+            # Record fresh results in the sidecar so the next run can skip
+            # text extraction for unchanged files
+            if pdf_path not in sidecar_hits and pdf_path.parent == sidecar_dir:
+                try:
+                    stats = pdf_path.stat()
+                except OSError:
+                    continue
+                _path, doc_num, pub_date = info
+                sidecar[pdf_path.name] = [
+                    stats.st_size,
+                    stats.st_mtime_ns,
+                    doc_num,
+                    pub_date.isoformat() if pub_date else None,
+                ]
+                sidecar_dirty = True
+
+    if sidecar_dirty and sidecar_dir is not None:
+        _save_info_sidecar(sidecar_dir, sidecar)
+
+    # Sort by document number (descending), then filter in a single pass.
+    # For undated PDFs, doc numbers are assigned sequentially so anything
+    # above 1800 is safely after the inauguration.
     pdf_info.sort(key=lambda x: x[1], reverse=True)
 
-    # Then filter and create final list
+    sorted_pdf_files = []
+    log_lines = []
     for pdf_path, doc_num, pub_date in pdf_info:
         if pub_date is not None:
-            if pub_date.date() >= INAUGURATION_DATE.date():
-                sorted_pdf_files.append((pdf_path, doc_num))
-                console.print(
-                    f"[blue]Including {pdf_path.name} (Doc #{doc_num}, Date: {pub_date.strftime('%B %d, %Y')})[/blue]"
-                )
-            else:
-                console.print(
-                    f"[yellow]Skipping {pdf_path.name} (Doc #{doc_num}, Date: {pub_date.strftime('%B %d, %Y')})[/yellow]"
-                )
+            included = pub_date.date() >= _INAUGURATION_CUTOFF
+            date_display = pub_date.strftime("%B %d, %Y")
         else:
-            # If we couldn't get the date, use doc number as a proxy
-            # Doc numbers are assigned sequentially, so we can use them to estimate dates
-            # Being more conservative with the cutoff
-            if doc_num > 1800:  # Increased threshold to be safer
-                sorted_pdf_files.append((pdf_path, doc_num))
-                console.print(
-                    f"[blue]Including {pdf_path.name} (Doc #{doc_num}, Date: Unknown)[/blue]"
-                )
-            else:
-                console.print(
-                    f"[yellow]Skipping {pdf_path.name} (Doc #{doc_num}, Date: Unknown - likely before Jan 20)[/yellow]"
-                )
+            included = doc_num > 1800
+            date_display = "Unknown" if included else "Unknown - likely before Jan 20"
+        if included:
+            sorted_pdf_files.append((pdf_path, doc_num))
+            log_lines.append(
+                f"[blue]Including {pdf_path.name} (Doc #{doc_num}, Date: {date_display})[/blue]"
+            )
+        else:
+            log_lines.append(
+                f"[yellow]Skipping {pdf_path.name} (Doc #{doc_num}, Date: {date_display})[/yellow]"
+            )
+
+    # One buffered print; rich re-renders per call, which dominates the
+    # bookkeeping cost for large merge sets
+    if log_lines:
+        console.print("\n".join(log_lines))
 
     if not sorted_pdf_files:
         console.print("[red]No valid PDFs found after filtering[/red]")
         return
 
     console.print("[blue]Merging PDFs in chronological order (newest first)[/blue]")
+
+    # Very large merge sets go through on-disk batches to bound peak memory
+    if len(sorted_pdf_files) > _MERGE_BATCH_SIZE:
+        _merge_in_batches(sorted_pdf_files, output, compress_streams)
+        return
+
     merger = PdfWriter()
 
-    # First clean each PDF to make it deterministic
-    for pdf_path, doc_num in sorted_pdf_files:
+    # Stream pages from each source straight into the merger; building an
+    # intermediate cleaned writer per file doubled the pages held in memory
+    for index, (pdf_path, doc_num) in enumerate(sorted_pdf_files, start=1):
         console.print(
             f"[yellow]Adding {pdf_path.name} (Doc #{doc_num}) to merged PDF[/yellow]"
         )
-        cleaned_writer = PDFUtils.clean_pdf_for_deterministic_output(pdf_path)
-
-        # Transfer all pages from the cleaned writer to the merger
-        for page in cleaned_writer.pages:
+        reader = PDFUtils.get_reader(pdf_path)
+        for page in reader.pages:
             merger.add_page(page)
+        if index % _COMPRESS_EVERY == 0:
+            merger.compress_identical_objects(
+                remove_identicals=True, remove_orphans=True
+            )
+
+    # Optionally deflate content streams for a smaller merged file
+    if compress_streams:
+        console.print("[blue]Compressing page content streams[/blue]")
+        for page in merger.pages:
+            page.compress_content_streams()
 
-    # First compress identical objects, then remove metadata in the merged PDF as well
+    # Compress identical objects and remove metadata once on the merged PDF,
+    # which keeps the output deterministic without per-file cleaning passes
     merger.compress_identical_objects(remove_identicals=True, remove_orphans=True)
     merger.metadata = None
 
     # Write the merged PDF
-    with open(output, "wb") as output_file:
+    with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as output_file:
         merger.write(output_file)
     merger.close()
     console.print(
@@ -5,12 +5,18 @@ It scans for PDFs, extracts metadata, and saves the information as JSON.
 """
 
 import argparse
+import concurrent.futures
 import glob
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from executive_orders_pdf.utils import ConfigUtils, FileSystemUtils, PDFUtils, console
 
+# Minimum number of PDFs before fanning metadata extraction out across
+# processes pays for the worker startup cost
+_PARALLEL_SUMMARY_MIN = 8
+
 
 def main(priority_president: str = "trump") -> list[dict[str, Any]]:
     """
@@ -23,36 +29,58 @@ def main(priority_president: str = "trump") -> list[dict[str, Any]]:
     combined_pdfs_dir = Path("combined_pdfs")
     FileSystemUtils.ensure_directory(combined_pdfs_dir)
 
-    # Find all PDFs in the combined_pdfs directory
-    pdf_files = [Path(f) for f in glob.glob("combined_pdfs/*.pdf")]
+    # Find all PDFs in the combined_pdfs directory; scandir gives us the
+    # stat results for free, so get_pdf_info doesn't stat each file again
+    with os.scandir(combined_pdfs_dir) as entries:
+        pdf_files: list[tuple[Path, Optional[os.stat_result]]] = [
+            (Path(entry.path), entry.stat())
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
 
     # If no PDFs found in combined_pdfs, check for PDFs in root and move them
     if not pdf_files:
         root_pdfs = [Path(f) for f in glob.glob("*.pdf")]
-        pdf_files = FileSystemUtils.move_files_to_directory(
-            root_pdfs, combined_pdfs_dir
-        )
-
-    pdf_summaries = []
-
-    for pdf_file in pdf_files:
-        info = PDFUtils.get_pdf_info(pdf_file)
-        if info:
-            pdf_summaries.append(info)
+        pdf_files = [
+            (moved, None)
+            for moved in FileSystemUtils.move_files_to_directory(
+                root_pdfs, combined_pdfs_dir
+            )
+        ]
+
+    # Parsing each PDF's xref table is CPU-bound pure-Python work, so large
+    # collections fan out across processes; get_pdf_info is self-contained
+    # and its (path, stats) arguments pickle cleanly
+    if len(pdf_files) >= _PARALLEL_SUMMARY_MIN:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            results = executor.map(
+                PDFUtils.get_pdf_info,
+                [path for path, _ in pdf_files],
+                [stats for _, stats in pdf_files],
+                chunksize=4,
+            )
+            pdf_summaries = [info for info in results if info]
+    else:
+        pdf_summaries = []
+        for pdf_file, stats in pdf_files:
+            info = PDFUtils.get_pdf_info(pdf_file, stats=stats)
+            if info:
+                pdf_summaries.append(info)
 
     # Sort with priority president's executive orders first, then by year (descending)
-    def sort_key(x: dict[str, Any]) -> tuple[int, int, str]:
-        # Normalize names for comparison
-        president_name = x["president"].lower()
-        priority_name = priority_president.lower()
+    priority_name = priority_president.lower()
 
-        # Check if this president matches the priority president
-        is_priority = priority_name in president_name
-        return (0 if is_priority else 1, x["year"], x["president"])
+    def sort_key(x: dict[str, Any]) -> tuple[int, int, str]:
+        # get_pdf_info precomputes the lowercased name and numeric year;
+        # negate the year so newest sorts first without reverse=True
+        president_name = x["president_lc"]
+        return (
+            0 if priority_name in president_name else 1,
+            -x["year_int"],
+            president_name,
+        )
 
-    pdf_summaries.sort(
-        key=sort_key, reverse=False
-    )  # False because we're using 0/1 for priority
+    pdf_summaries.sort(key=sort_key)
 
     # Save the summary as JSON
     ConfigUtils.save_json_config(pdf_summaries, Path("pdf_summary.json"))
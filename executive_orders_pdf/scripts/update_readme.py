@@ -8,22 +8,65 @@ import argparse
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Optional
 
 from executive_orders_pdf.utils import ConfigUtils, FileSystemUtils, console
 
+# Patterns for the sections not managed by literal markers, compiled once
+# at import instead of per invocation
+_TABLE_FALLBACK_RE = re.compile(
+    r"(## Available Executive Order Collections\n\n\|.*?\n\|.*?\n)((?:\|.*?\n)*)",
+    re.DOTALL,
+)
+_LATEST_RE = re.compile(r"(## Latest Combined PDFs.*?)(\n## |\Z)", re.DOTALL)
 
-def main(priority_president: str = "trump") -> None:
+
+def _splice_between_markers(
+    text: str, start_marker: str, end_marker: str, payload: str
+) -> Optional[str]:
+    """
+    Replace the content between two literal markers with new payload.
+
+    The markers are plain literals, so str.find + slicing does the job in
+    linear time; the regex-with-DOTALL equivalent rescans the whole document
+    per replacement.
+
+    Args:
+        text: Document to splice into
+        start_marker: Literal marker opening the managed section
+        end_marker: Literal marker closing the managed section
+        payload: New content to place between the markers
+
+    Returns:
+        The spliced document, or None if either marker is missing
+    """
+    start = text.find(start_marker)
+    if start == -1:
+        return None
+    end = text.find(end_marker, start)
+    if end == -1:
+        return None
+    return text[:start] + start_marker + "\n" + payload + "\n" + text[end:]
+
+
+def main(
+    priority_president: str = "trump",
+    pdf_summaries: Optional[list[dict[str, Any]]] = None,
+) -> None:
     """
     Main function to update the README.md with PDF summary information.
 
     Args:
         priority_president: President name to prioritize in the README (default: "trump")
+        pdf_summaries: Optional summary list, e.g. the return value of
+            pdf_summary.main(); skips the pdf_summary.json round-trip
     """
     # Ensure the combined_pdfs directory exists
     FileSystemUtils.ensure_directory(Path("combined_pdfs"))
 
-    # Load the PDF summary
-    pdf_summaries = ConfigUtils.load_json_config(Path("pdf_summary.json"))
+    # Load the PDF summary from disk only when not handed one in-process
+    if pdf_summaries is None:
+        pdf_summaries = ConfigUtils.load_json_config(Path("pdf_summary.json"))
     if not pdf_summaries:
         console.print("[red]Error: No PDF summaries found in pdf_summary.json[/red]")
         return
@@ -36,25 +79,43 @@ def main(priority_president: str = "trump") -> None:
         console.print("[red]Error: README.md not found[/red]")
         return
 
-    # Create the PDF table for README
-    pdf_table = ""  # Remove the header since it's already in the README
-    pdf_table += "| President | Year | Pages | Size | Last Updated | Download |\n"
-    pdf_table += "|:----------|:-----|:------|:-----|:-------------|:---------|\n"
+    # Create the PDF table for README; collect rows and join once rather
+    # than growing a string with += per row (no header — it's in the README)
+    table_rows = [
+        "| President | Year | Pages | Size | Last Updated | Download |\n",
+        "|:----------|:-----|:------|:-----|:-------------|:---------|\n",
+    ]
+    table_rows.extend(
+        f'| {pdf["president"]} | {pdf["year"]} | {pdf["pages"]} | {pdf["size_mb"]} MB '
+        f'| {pdf["last_modified"]} | [Download](combined_pdfs/{pdf["filename"]}) |\n'
+        for pdf in pdf_summaries
+    )
+    pdf_table = "".join(table_rows)
 
+    # Get total statistics and the priority president's PDFs in one pass
+    priority_name = priority_president.lower()
+    priority_pdfs = []
+    total_pages = 0
+    total_size_mb = 0.0
     for pdf in pdf_summaries:
-        pdf_table += f'| {pdf["president"]} | {pdf["year"]} | {pdf["pages"]} | {pdf["size_mb"]} MB | {pdf["last_modified"]} | '
-        pdf_table += f'[Download](combined_pdfs/{pdf["filename"]}) |\n'
-
-    # Get total statistics
-    total_pages = sum(pdf.get("pages", 0) for pdf in pdf_summaries)
-    total_size_mb = sum(pdf.get("size_mb", 0) for pdf in pdf_summaries)
+        total_pages += pdf.get("pages", 0)
+        total_size_mb += pdf.get("size_mb", 0)
+        # Prefer the precomputed lowercased name; fall back for summary
+        # JSON written before the derived fields existed
+        president_lc = pdf.get("president_lc") or pdf["president"].lower()
+        if priority_name in president_lc:
+            priority_pdfs.append(pdf)
 
     # Add summary statistics
-    stats_text = "## Summary Statistics\n\n"
-    stats_text += f"- **Total Executive Order Collections:** {len(pdf_summaries)}\n"
-    stats_text += f"- **Total Pages:** {total_pages}\n"
-    stats_text += f"- **Total Size:** {round(total_size_mb, 2)} MB\n"
-    stats_text += f"- **Last Updated:** {datetime.now().strftime('%Y-%m-%d')}\n"
+    stats_text = "".join(
+        (
+            "## Summary Statistics\n\n",
+            f"- **Total Executive Order Collections:** {len(pdf_summaries)}\n",
+            f"- **Total Pages:** {total_pages}\n",
+            f"- **Total Size:** {round(total_size_mb, 2)} MB\n",
+            f"- **Last Updated:** {datetime.now().strftime('%Y-%m-%d')}\n",
+        )
+    )
 
     # Define marker patterns to locate where to insert the dynamic content
     table_marker_start = "<!-- PDF_TABLE_START -->"
@@ -62,61 +123,50 @@ def main(priority_president: str = "trump") -> None:
     stats_marker_start = "<!-- STATS_START -->"
     stats_marker_end = "<!-- STATS_END -->"
 
-    # Replace content between markers
-    if table_marker_start in readme_content and table_marker_end in readme_content:
-        readme_content = re.sub(
-            f"{re.escape(table_marker_start)}.*?{re.escape(table_marker_end)}",
-            f"{table_marker_start}\n{pdf_table}\n{table_marker_end}",
-            readme_content,
-            flags=re.DOTALL,
-        )
+    # Replace content between markers; both marker pairs are literals, so
+    # an index-based splice avoids rescanning the README with DOTALL regexes
+    spliced = _splice_between_markers(
+        readme_content, table_marker_start, table_marker_end, pdf_table
+    )
+    if spliced is not None:
+        readme_content = spliced
     else:
         # If markers are missing, find the table section and replace it
-        table_pattern = r"(## Available Executive Order Collections\n\n\|.*?\n\|.*?\n)((?:\|.*?\n)*)"
-        if re.search(table_pattern, readme_content, re.DOTALL):
-            readme_content = re.sub(
-                table_pattern,
+        if _TABLE_FALLBACK_RE.search(readme_content):
+            readme_content = _TABLE_FALLBACK_RE.sub(
                 f"{table_marker_start}\n{pdf_table}\n{table_marker_end}",
                 readme_content,
-                flags=re.DOTALL,
             )
 
-    readme_content = re.sub(
-        f"{re.escape(stats_marker_start)}.*?{re.escape(stats_marker_end)}",
-        f"{stats_marker_start}\n{stats_text}\n{stats_marker_end}",
-        readme_content,
-        flags=re.DOTALL,
+    spliced = _splice_between_markers(
+        readme_content, stats_marker_start, stats_marker_end, stats_text
     )
+    if spliced is not None:
+        readme_content = spliced
 
     # Update the 'Latest Combined PDFs' section
     if pdf_summaries:
-        # Get priority president's latest executive orders first
-        priority_name = priority_president.lower()
-        priority_pdfs = [
-            pdf for pdf in pdf_summaries if priority_name in pdf["president"].lower()
-        ]
-
-        if priority_pdfs:
-            latest_pdf = priority_pdfs[
-                0
-            ]  # Take the first priority PDF (should be latest year)
-            president_display = latest_pdf["president"]
-        else:
-            latest_pdf = pdf_summaries[0]  # Fallback to first PDF if no priority PDFs
-            president_display = latest_pdf["president"]
-
-        latest_section = "## Latest Combined PDFs\n\n"
-        latest_section += f"📄 [Download {president_display} Executive Orders {latest_pdf['year']} (PDF)](combined_pdfs/{latest_pdf['filename']})\n\n"
-        latest_section += f"*Currently showing the latest executive orders from {president_display}.*\n\n"
-        latest_section += "*These files are automatically updated daily through GitHub Actions and stored in the `combined_pdfs` folder.*"
-
-        latest_pattern = r"(## Latest Combined PDFs.*?)(\n## |\Z)"
-        if re.search(latest_pattern, readme_content, re.DOTALL):
-            readme_content = re.sub(
-                latest_pattern,
+        # Pick the latest by numeric year explicitly rather than leaning on
+        # whatever order pdf_summary happened to sort the list in
+        def latest_key(pdf: dict[str, Any]) -> int:
+            return int(pdf.get("year_int", 0))
+
+        latest_pdf = max(priority_pdfs or pdf_summaries, key=latest_key)
+        president_display = latest_pdf["president"]
+
+        latest_section = "".join(
+            (
+                "## Latest Combined PDFs\n\n",
+                f"📄 [Download {president_display} Executive Orders {latest_pdf['year']} (PDF)](combined_pdfs/{latest_pdf['filename']})\n\n",
+                f"*Currently showing the latest executive orders from {president_display}.*\n\n",
+                "*These files are automatically updated daily through GitHub Actions and stored in the `combined_pdfs` folder.*",
+            )
+        )
+
+        if _LATEST_RE.search(readme_content):
+            readme_content = _LATEST_RE.sub(
                 latest_section + r"\n\n\2",
                 readme_content,
-                flags=re.DOTALL,
             )
 
     # Write the updated README
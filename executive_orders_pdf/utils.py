@@ -1,6 +1,10 @@
 """Common utility functions and classes used across the project."""
 
+import functools
 import json
+import mmap
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -12,27 +16,89 @@ from rich.progress import Progress
 # Initialize console for consistent output
 console = Console()
 
+# Summary filenames follow president_description_year.pdf; one precompiled
+# match replaces the per-file strip/split/index dance in get_pdf_info
+_SUMMARY_NAME_RE = re.compile(r"^([^_]+)_.+_(\d{4})$")
+
+# Above this size, map the file instead of letting PdfReader copy the whole
+# body into an in-memory BytesIO; the kernel page cache backs reads and no
+# Python-side duplicate of the bytes is made
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
 
 class PDFUtils:
     """Common PDF-related utility functions."""
 
     @staticmethod
-    def get_pdf_info(pdf_path: Path) -> Optional[dict[str, Any]]:
+    @functools.lru_cache(maxsize=256)
+    def _cached_reader(path_str: str, mtime_ns: int, size: int) -> PdfReader:
+        """Parse a PDF once per (path, mtime, size) triple; see get_reader."""
+        if size >= _MMAP_MIN_SIZE:
+            try:
+                with open(path_str, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # The reader keeps the mapping alive via its stream
+                # reference; mmap satisfies the read/seek protocol even
+                # though the stub only admits IO
+                return PdfReader(mapped)  # type: ignore[arg-type]
+            except (OSError, ValueError):
+                # Zero-length race, exotic filesystem, etc.; copy instead
+                pass
+        return PdfReader(path_str)
+
+    @staticmethod
+    def get_reader(pdf_path: Path) -> PdfReader:
+        """
+        Return a PdfReader for a file, reusing a cached parse when possible.
+
+        Verification, date extraction and merging each parsed the same file
+        from scratch; keying the cache on the file's stat result means the
+        xref/catalog parse happens once per file per change.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            PdfReader for the file's current contents
+        """
+        try:
+            stats = pdf_path.stat()
+        except OSError:
+            # Let PdfReader raise its own error for missing/unreadable files
+            return PdfReader(pdf_path)
+        return PDFUtils._cached_reader(str(pdf_path), stats.st_mtime_ns, stats.st_size)
+
+    @staticmethod
+    def get_pdf_info(
+        pdf_path: Path, stats: Optional[os.stat_result] = None
+    ) -> Optional[dict[str, Any]]:
         """
         Extract metadata from a PDF file.
 
         Args:
             pdf_path: Path to the PDF file
+            stats: Optional pre-fetched stat result (e.g. from os.scandir),
+                saving a syscall per file
 
         Returns:
             Dictionary with PDF metadata or None if processing failed
         """
         try:
-            reader = PdfReader(pdf_path)
-            num_pages = len(reader.pages)
-
-            # Get file stats
-            stats = pdf_path.stat()
+            reader = PDFUtils.get_reader(pdf_path)
+            # Read the page count straight off the page tree root; len(pages)
+            # materializes every page object just to count them
+            try:
+                # The trailer values are dictionaries at runtime; the stubs
+                # only know them as PdfObject
+                num_pages = int(
+                    reader.trailer["/Root"]["/Pages"]["/Count"]  # type: ignore[index]
+                )
+            except (KeyError, TypeError, ValueError):
+                num_pages = len(reader.pages)
+
+            # Get file stats unless the caller already has them
+            if stats is None:
+                stats = pdf_path.stat()
             size_mb = stats.st_size / (1024 * 1024)
             last_modified = datetime.fromtimestamp(stats.st_mtime).strftime(
                 "%Y-%m-%d %H:%M:%S"
@@ -40,19 +106,23 @@ class PDFUtils:
 
             # Parse filename to get president and year
             filename = pdf_path.name
-            president = "Unknown"
-            year = "Unknown"
-
-            parts = filename.replace(".pdf", "").split("_")
-            if len(parts) >= 3:
-                president = parts[0].replace("-", " ").title()
-                year = parts[-1]
+            match = _SUMMARY_NAME_RE.match(pdf_path.stem)
+            if match:
+                president = match.group(1).replace("-", " ").title()
+                year = match.group(2)
+            else:
+                president = "Unknown"
+                year = "Unknown"
 
             return {
                 "filename": filename,
                 "base_filename": filename,
                 "president": president,
+                # Derived fields computed once here so consumers don't
+                # re-lower/re-parse per read
+                "president_lc": president.lower(),
                 "year": year,
+                "year_int": int(year) if year.isdigit() else 0,
                 "pages": num_pages,
                 "size_mb": round(size_mb, 2),
                 "last_modified": last_modified,
@@ -72,12 +142,12 @@ class PDFUtils:
         Returns:
             PdfWriter with cleaned PDF content
         """
-        reader = PdfReader(pdf_path)
+        reader = PDFUtils.get_reader(pdf_path)
         writer = PdfWriter()
 
-        # Copy pages without any metadata
-        for page in reader.pages:
-            writer.add_page(page)
+        # Bulk-copy the pages; pypdf's append path preserves shared object
+        # identity, so per-page add_page plus later dedup work is avoided
+        writer.append_pages_from_reader(reader)
 
         # First compress identical objects, then remove metadata
         writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
@@ -88,7 +158,35 @@ class PDFUtils:
     @staticmethod
     def verify_pdf(file_path: Path) -> bool:
         """
-        Verify that a PDF is valid and not corrupted.
+        Cheaply verify that a file looks like a complete PDF.
+
+        Only checks the %PDF- header magic and the trailing %%EOF marker,
+        which catches truncated or non-PDF downloads without paying for a
+        full structural parse; use verify_pdf_deep for that.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            bool: True if PDF looks valid, False otherwise
+        """
+        try:
+            with open(file_path, "rb") as f:
+                if f.read(5) != b"%PDF-":
+                    return False
+                size = f.seek(0, 2)
+                f.seek(max(size - 1024, 0))
+                return b"%%EOF" in f.read()
+        except OSError as e:
+            console.print(
+                f"[red]PDF verification failed for {file_path}: {str(e)}[/red]"
+            )
+            return False
+
+    @staticmethod
+    def verify_pdf_deep(file_path: Path) -> bool:
+        """
+        Fully verify a PDF by parsing its structure.
 
         Args:
             file_path: Path to the PDF file
@@ -97,7 +195,7 @@ class PDFUtils:
             bool: True if PDF is valid, False otherwise
         """
         try:
-            reader = PdfReader(file_path)
+            reader = PDFUtils.get_reader(file_path)
             _ = len(reader.pages)
             return True
         except Exception as e:
@@ -118,6 +216,9 @@ class FileSystemUtils:
         Args:
             directory: Path to the directory
         """
+        # Skip the mkdir syscall chain in the common already-exists case
+        if directory.is_dir():
+            return
         directory.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
@@ -188,12 +289,19 @@ class ProgressTracker:
         """
         Initialize progress tracker.
 
+        Progress rendering is skipped entirely on non-TTY output (e.g. CI
+        logs), where the ANSI updates are pure overhead.
+
         Args:
             total: Total number of items to process
             description: Description of the progress task
         """
-        self.progress = Progress()
-        self.task_id = self.progress.add_task(f"[cyan]{description}...", total=total)
+        self.progress: Optional[Progress] = Progress() if console.is_terminal else None
+        self.task_id = (
+            self.progress.add_task(f"[cyan]{description}...", total=total)
+            if self.progress
+            else None
+        )
 
     def update(self, advance: int = 1) -> None:
         """
@@ -202,14 +310,16 @@ class ProgressTracker:
         Args:
             advance: Number of items processed
         """
-        if self.progress:
+        if self.progress is not None and self.task_id is not None:
             self.progress.update(self.task_id, advance=advance)
 
     def __enter__(self) -> "ProgressTracker":
         """Context manager entry."""
-        self.progress.start()
+        if self.progress:
+            self.progress.start()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit."""
-        self.progress.stop()
+        if self.progress:
+            self.progress.stop()
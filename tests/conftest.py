@@ -1,11 +1,24 @@
 """Global pytest fixtures and configuration."""
 
-import asyncio
 import warnings
-from unittest.mock import patch
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional accelerator
+    uvloop = None
+
+
+if uvloop is not None:
+
+    # optionalhook keeps pytest-asyncio versions without this hook from
+    # rejecting the conftest outright
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
 
 # Filter out coroutine warnings which are hard to eliminate completely
 @pytest.fixture(autouse=True)
@@ -16,22 +29,3 @@ def ignore_coroutine_warnings():
             "ignore", message="coroutine .* was never awaited", category=RuntimeWarning
         )
         yield
-
-
-# Patch asyncio.run to handle mocked coroutines better
-@pytest.fixture(autouse=True)
-def mock_asyncio_run():
-    """
-    Patch asyncio.run to handle mocked coroutines better.
-    This is a global fixture that applies to all tests.
-    """
-    original_run = asyncio.run
-
-    def patched_run(coro):
-        """Patched version of asyncio.run that handles mocked coroutines."""
-        if hasattr(coro, "__await__"):
-            return original_run(coro)
-        return coro  # If it's not a real coroutine, just return it
-
-    with patch("asyncio.run", patched_run):
-        yield
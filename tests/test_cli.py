@@ -1,6 +1,7 @@
 """Tests for the CLI module."""
 
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +18,9 @@ except ImportError:
     # Skip these tests if cli.py doesn't exist
     pytestmark = pytest.mark.skip("cli.py module not found")
 
+# Shared by every mock config below; built once at import
+_BASE_URL = "https://www.federalregister.gov/presidential-documents/executive-orders"
+
 
 def test_load_config_default():
     """Test loading default configuration when no file is provided."""
@@ -49,7 +53,7 @@ def test_load_config_custom():
     # Mock the file operations
     with (
         patch("builtins.open", MagicMock()),
-        patch("yaml.safe_load", return_value=config_data),
+        patch("yaml.load", return_value=config_data),
     ):
         # Mock Path.exists to return True
         with patch.object(Path, "exists", return_value=True):
@@ -64,9 +68,25 @@ def test_load_config_custom():
     assert config["url"]["year"] == "2023"
 
 
-def test_cli_help():
+# One runner serves every CLI test; CliRunner is stateless between invokes
+@pytest.fixture(scope="module")
+def runner():
+    """Shared CliRunner for the CLI invocation tests."""
+    return CliRunner()
+
+
+@pytest.fixture
+def cli_mocks():
+    """Apply the common CLI patch set once and hand back the mocks."""
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(patch.object(cli_module, name))
+            for name in ("load_config", "download_and_merge", "asyncio")
+        }
+
+
+def test_cli_help(runner):
     """Test that CLI help message works."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["--help"])
 
     # Verify that the command executed successfully
@@ -78,94 +98,76 @@ def test_cli_help():
     )
 
 
-def test_cli_with_url():
-    """Test CLI with direct URL argument."""
-    with patch.object(cli_module, "download_and_merge"):
-        with patch.object(cli_module, "asyncio") as mock_asyncio:
-            # Configure mock_run to return a simple value
-            mock_asyncio.run.return_value = None
-
-            runner = CliRunner()
-            result = runner.invoke(
-                cli,
-                [
-                    "https://example.com/orders",
-                    "--output",
-                    "output.pdf",
-                    "--download-dir",
-                    "downloads",
-                    "--concurrent-downloads",
-                    "3",
-                ],
-            )
-
-            # Verify that the command executed successfully
-            assert result.exit_code == 0
-
-            # Verify asyncio.run was called
-            mock_asyncio.run.assert_called_once()
-
-
-def test_cli_with_president_and_year():
-    """Test CLI with president and year options."""
-    with patch.object(cli_module, "load_config") as mock_load_config:
-        with patch.object(cli_module, "download_and_merge"):
-            with patch.object(cli_module, "asyncio") as mock_asyncio:
-                # Mock the config to return default values
-                mock_load_config.return_value = {
-                    "download": {"concurrent_downloads": 5},
-                    "output": {
-                        "download_dir": "downloads",
-                        "default_filename": "default.pdf",
-                    },
-                    "url": {
-                        "base_url": "https://www.federalregister.gov/presidential-documents/executive-orders"
-                    },
-                }
-
-                # Configure mock_run to return a simple value
-                mock_asyncio.run.return_value = None
-
-                runner = CliRunner()
-                result = runner.invoke(cli, ["--president", "biden", "--year", "2023"])
-
-                # Verify that the command executed successfully
-                assert result.exit_code == 0
-
-                # Verify asyncio.run was called
-                mock_asyncio.run.assert_called_once()
-
-
-def test_cli_with_config_file():
-    """Test CLI with a config file."""
-    with patch.object(cli_module, "load_config") as mock_load_config:
-        with patch.object(cli_module, "download_and_merge"):
-            with patch.object(cli_module, "asyncio") as mock_asyncio:
-                # Mock the config that would be loaded
-                mock_load_config.return_value = {
-                    "download": {"concurrent_downloads": 10},
-                    "output": {
-                        "download_dir": "config_downloads",
-                        "default_filename": "from_config.pdf",
-                    },
-                    "url": {
-                        "base_url": "https://www.federalregister.gov/presidential-documents/executive-orders",
-                        "president": "config-president",
-                        "year": "2024",
-                    },
-                }
-
-                # Configure mock_run to return a simple value
-                mock_asyncio.run.return_value = None
-
-                runner = CliRunner()
-                result = runner.invoke(cli, ["--config", "config.yaml"])
-
-                # Verify that the command executed successfully
-                assert result.exit_code == 0
-
-                # Verify load_config was called with the right file
-                mock_load_config.assert_called_once_with("config.yaml")
-
-                # Verify asyncio.run was called
-                mock_asyncio.run.assert_called_once()
+@pytest.mark.parametrize(
+    "cli_args,loaded_config,expected_config_arg",
+    [
+        pytest.param(
+            [
+                "https://example.com/orders",
+                "--output",
+                "output.pdf",
+                "--download-dir",
+                "downloads",
+                "--concurrent-downloads",
+                "3",
+            ],
+            None,  # Real load_config; every value comes from the command line
+            None,
+            id="direct-url",
+        ),
+        pytest.param(
+            ["--president", "biden", "--year", "2023"],
+            {
+                "download": {"concurrent_downloads": 5},
+                "output": {
+                    "download_dir": "downloads",
+                    "default_filename": "default.pdf",
+                },
+                "url": {"base_url": _BASE_URL},
+            },
+            None,
+            id="president-and-year",
+        ),
+        pytest.param(
+            ["--config", "config.yaml"],
+            {
+                "download": {"concurrent_downloads": 10},
+                "output": {
+                    "download_dir": "config_downloads",
+                    "default_filename": "from_config.pdf",
+                },
+                "url": {
+                    "base_url": _BASE_URL,
+                    "president": "config-president",
+                    "year": "2024",
+                },
+            },
+            "config.yaml",
+            id="config-file",
+        ),
+    ],
+)
+def test_cli_invocations(
+    runner, cli_mocks, cli_args, loaded_config, expected_config_arg
+):
+    """Test CLI invocations that differ only in arguments and config."""
+    # Configure mock_run to return a simple value
+    cli_mocks["asyncio"].run.return_value = None
+
+    if loaded_config is not None:
+        cli_mocks["load_config"].return_value = loaded_config
+    else:
+        # Pass through to the real loader so defaults come from the code
+        cli_mocks["load_config"].side_effect = load_config
+
+    result = runner.invoke(cli, cli_args)
+
+    # Verify that the command executed successfully
+    assert result.exit_code == 0
+
+    # Verify asyncio.run was called
+    cli_mocks["asyncio"].run.assert_called_once()
+
+    # Verify load_config was called with the right file, when specified
+    if expected_config_arg is not None:
+        cli_mocks["load_config"].assert_called_once_with(expected_config_arg)
@@ -1,39 +1,46 @@
 """Tests for the PDFDownloader class."""
 
-import os
+import shutil
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
-from aiohttp import ClientSession
 from rich.progress import Progress
+from tenacity import wait_none
 
 from executive_orders_pdf.core import PDFDownloader
 
+# Minimal PDF header shared by every test that needs a file on disk
+_PDF_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_path(tmp_path_factory):
+    """Write the sample PDF once per session; tests copy or link it."""
+    path = tmp_path_factory.mktemp("pdf") / "sample.pdf"
+    path.write_bytes(_PDF_HEADER)
+    return path
+
 
 @pytest.fixture
-def download_dir():
+def download_dir(tmp_path):
     """Create a temporary download directory."""
-    temp_dir = Path("test_downloads")
-    temp_dir.mkdir(exist_ok=True)
-    yield temp_dir
-    # Clean up after tests
-    for file in temp_dir.glob("*.pdf"):
-        try:
-            os.unlink(file)
-        except OSError:
-            pass
-    try:
-        temp_dir.rmdir()
-    except OSError:
-        pass
+    # tmp_path is per-test and per-xdist-worker, so no manual cleanup and
+    # no collisions on a shared directory in the repo checkout
+    temp_dir = tmp_path / "downloads"
+    temp_dir.mkdir()
+    return temp_dir
 
 
 # Use a regular fixture instead of an async one
 @pytest.fixture
 def mock_client_session():
     """Create a mock aiohttp client session."""
-    mock = MagicMock(spec=ClientSession)
+    # No spec= here: the tests only touch .get and the context-manager
+    # protocol, and spec'ing against ClientSession walks its full (large)
+    # attribute surface on every fixture instantiation
+    mock = MagicMock()
     # Properly configure get method that returns a context manager
     context_manager = MagicMock()
     response = MagicMock()
@@ -42,11 +49,10 @@ def mock_client_session():
     mock.get.return_value = context_manager
     context_manager.__aenter__.return_value = response
 
-    # Make read method return a coroutine (async method)
-    async def mock_read():
-        return b"test PDF content"
-
-    response.read = mock_read
+    # AsyncMock awaits natively instead of synthesizing a coroutine
+    # wrapper on every call the way a hand-rolled async def or MagicMock
+    # would
+    response.read = AsyncMock(return_value=b"test PDF content")
     response.raise_for_status = MagicMock()
 
     return mock
@@ -77,7 +83,7 @@ async def test_download_file_new_file(download_dir):
     # Create a mock for the implementation of download_file
     async def mock_download_impl(session, url):
         local_filename = download_dir / Path(url).name
-        downloader.downloaded_files.add(local_filename)
+        downloader.downloaded_files.add(str(local_filename))
         return local_filename
 
     # Replace the download_file method with our mock
@@ -89,25 +95,23 @@ async def test_download_file_new_file(download_dir):
     # Assertions
     expected_path = download_dir / "test.pdf"
     assert result == expected_path
-    assert expected_path in downloader.downloaded_files
+    assert str(expected_path) in downloader.downloaded_files
 
 
 @pytest.mark.asyncio
 @patch("executive_orders_pdf.core.PDFUtils.verify_pdf")
 async def test_download_file_existing_file(
-    mock_verify_pdf, download_dir, mock_client_session
+    mock_verify_pdf, download_dir, mock_client_session, sample_pdf_path
 ):
     """Test downloading a file that already exists."""
     # Mock PDF verification to return True for existing file
     mock_verify_pdf.return_value = True
 
-    # Create a mock file that "exists"
+    # Copy the session-scoped sample into place rather than rewriting its
+    # bytes for every invocation
     url = "https://example.com/existing.pdf"
     existing_file = download_dir / "existing.pdf"
-
-    # Create and configure the file with some content
-    with open(existing_file, "wb") as f:
-        f.write(b"Valid PDF content")
+    shutil.copyfile(sample_pdf_path, existing_file)
 
     # Create downloader and download file
     downloader = PDFDownloader(download_dir=download_dir)
@@ -115,7 +119,7 @@ async def test_download_file_existing_file(
 
     # Assertions
     assert result == existing_file
-    assert existing_file in downloader.downloaded_files
+    assert str(existing_file) in downloader.downloaded_files
     # Session.get should not be called since file exists and is valid
     mock_client_session.get.assert_not_called()
     # PDF verification should have been called
@@ -143,7 +147,7 @@ async def test_download_file_with_progress(download_dir):
         local_filename = self.download_dir / Path(url_arg).name
 
         # Add file to downloaded_files
-        self.downloaded_files.add(local_filename)
+        self.downloaded_files.add(str(local_filename))
 
         # Manually update progress (important part we're testing)
         if self.progress:
@@ -161,19 +165,33 @@ async def test_download_file_with_progress(download_dir):
 
     # Verify the result
     assert result == expected_path
-    assert expected_path in downloader.downloaded_files
+    assert str(expected_path) in downloader.downloaded_files
 
     # Verify progress was updated
     mock_progress.update.assert_called_once_with("task-123", advance=1)
 
 
-# Skip the test that's difficult to mock due to the retry decorator
-@pytest.mark.skip("Difficult to mock with retry decorator")
 @pytest.mark.asyncio
 async def test_download_file_error_handling(download_dir):
     """Test error handling during download."""
-    # This test is skipped due to difficulties mocking the retry decorator
-    pass
+    downloader = PDFDownloader(download_dir=download_dir)
+
+    # Every attempt fails before any bytes arrive
+    mock_session = MagicMock()
+    mock_session.get.side_effect = aiohttp.ClientError("connection reset")
+
+    url = "https://example.com/broken.pdf"
+    # Zero out the exponential backoff so the retries run in fake-zero
+    # wall time instead of sleeping between attempts
+    with patch.object(PDFDownloader.download_file.retry, "wait", wait_none()):
+        with pytest.raises(aiohttp.ClientError):
+            await downloader.download_file(mock_session, url)
+
+    # All three attempts hit the network before the error was reraised
+    assert mock_session.get.call_count == 3
+    assert url in downloader.failed_downloads
+    assert str(download_dir / "broken.pdf") not in downloader.downloaded_files
+    assert not (download_dir / "broken.pdf").exists()
 
 
 @pytest.mark.asyncio
@@ -191,11 +209,13 @@ async def test_download_all(download_dir):
 
     async def mock_download_file(session, url):
         file_path = download_dir / Path(url).name
-        downloader.downloaded_files.add(file_path)
+        downloader.downloaded_files.add(str(file_path))
         return file_path
 
-    # Create a mock session that won't cause async issues
+    # Create a mock session that won't cause async issues; download_all owns
+    # the session it builds, so close() must be awaitable
     mock_session = MagicMock()
+    mock_session.close = AsyncMock()
 
     # Mock the ClientSession class to return our mocked instance
     with patch("aiohttp.ClientSession", return_value=mock_session):
@@ -208,5 +228,27 @@ async def test_download_all(download_dir):
 
     # Assertions
     assert len(results) == 3
-    expected_files = {download_dir / f"file{i}.pdf" for i in range(1, 4)}
+    # Join on the directory string once, and spell the three fixed
+    # elements out rather than spinning up an iterator for them
+    base = str(download_dir)
+    expected_files = {
+        f"{base}/file1.pdf",
+        f"{base}/file2.pdf",
+        f"{base}/file3.pdf",
+    }
     assert downloader.downloaded_files == expected_files
+
+
+@pytest.mark.asyncio
+async def test_set_concurrency(download_dir):
+    """Test resizing the download concurrency limit at runtime."""
+    downloader = PDFDownloader(download_dir=download_dir, concurrent_downloads=2)
+
+    await downloader.set_concurrency(5)
+    assert downloader.concurrent_downloads == 5
+
+    # Slots acquired under the new limit are tracked and released correctly
+    await downloader._acquire_slot()
+    assert downloader._active_downloads == 1
+    await downloader._release_slot()
+    assert downloader._active_downloads == 0
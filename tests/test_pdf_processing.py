@@ -4,7 +4,6 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from pypdf import PdfReader, PdfWriter
 
 from executive_orders_pdf.core import extract_pdf_links, merge_pdfs
 from executive_orders_pdf.utils import PDFUtils
@@ -33,9 +32,10 @@ async def test_extract_pdf_links_from_url(mock_extract_links):
 
 
 @pytest.mark.asyncio
-async def test_extract_pdf_links_from_file():
+async def test_extract_pdf_links_from_file(tmp_path):
     """Test extracting PDF links from a local file."""
-    # Create a temporary file with HTML content
+    # Write real HTML to disk; patching builtins.open would route every
+    # open() in every library through a mock for the test's duration
     html_content = """
     <html>
         <body>
@@ -46,14 +46,11 @@ async def test_extract_pdf_links_from_file():
         </body>
     </html>
     """
-
-    # Mock the open function
-    mock_open = mock_open = MagicMock()
-    mock_open.return_value.__enter__.return_value.read.return_value = html_content
+    html_file = tmp_path / "local_file.html"
+    html_file.write_text(html_content, encoding="utf-8")
 
     # Call the function with a file path
-    with patch("builtins.open", mock_open):
-        links = await extract_pdf_links("local_file.html", {})
+    links = await extract_pdf_links(str(html_file), {})
 
     # Assertions
     assert len(links) == 2
@@ -68,27 +65,27 @@ async def test_extract_pdf_links_from_file():
 def test_clean_pdf_for_deterministic_output():
     """Test cleaning a PDF to make it deterministic."""
     # Create a mock PDF
-    mock_reader = MagicMock(spec=PdfReader)
+    mock_reader = MagicMock()
     mock_page1 = MagicMock()
     mock_page2 = MagicMock()
     mock_reader.pages = [mock_page1, mock_page2]
 
     # Mock PdfWriter
-    mock_writer = MagicMock(spec=PdfWriter)
-
-    # Create the patches - use the correct module path
-    with (
-        patch("executive_orders_pdf.utils.PdfReader", return_value=mock_reader),
-        patch("executive_orders_pdf.utils.PdfWriter", return_value=mock_writer),
+    mock_writer = MagicMock()
+
+    # Both patches target the same module, so one patch.multiple applies
+    # them with shared bookkeeping
+    with patch.multiple(
+        "executive_orders_pdf.utils",
+        PdfReader=MagicMock(return_value=mock_reader),
+        PdfWriter=MagicMock(return_value=mock_writer),
     ):
         # Call the function
         result = PDFUtils.clean_pdf_for_deterministic_output(Path("test.pdf"))
 
     # Assertions
     assert result == mock_writer
-    assert mock_writer.add_page.call_count == 2
-    mock_writer.add_page.assert_any_call(mock_page1)
-    mock_writer.add_page.assert_any_call(mock_page2)
+    mock_writer.append_pages_from_reader.assert_called_once_with(mock_reader)
     mock_writer.compress_identical_objects.assert_called_once_with(
         remove_identicals=True, remove_orphans=True
     )
@@ -100,16 +97,8 @@ def test_merge_pdfs():
     # Create mock PDF files with proper FR document format
     pdf_files = {Path("2025-01801.pdf"), Path("2025-01802.pdf"), Path("2025-01803.pdf")}
 
-    # Create mock writers returned by clean_pdf_for_deterministic_output
-    mock_writers = []
-    for _ in range(3):
-        mock_writer = MagicMock()
-        mock_page = MagicMock()
-        mock_writer.pages = [mock_page]
-        mock_writers.append(mock_writer)
-
     # Create mock merged PDF writer
-    mock_merger = MagicMock(spec=PdfWriter)
+    mock_merger = MagicMock()
 
     # Mock PdfReader to simulate PDF content
     mock_reader = MagicMock()
@@ -121,19 +110,15 @@ def test_merge_pdfs():
 
     # Create the patches
     with (
-        patch(
-            "executive_orders_pdf.utils.PDFUtils.clean_pdf_for_deterministic_output",
-            side_effect=mock_writers,
-        ),
         patch("executive_orders_pdf.core.PdfWriter", return_value=mock_merger),
-        patch("executive_orders_pdf.core.PdfReader", return_value=mock_reader),
+        patch("executive_orders_pdf.utils.PdfReader", return_value=mock_reader),
         patch("builtins.open"),
     ):
         # Call the function
         merge_pdfs(pdf_files, Path("merged.pdf"))
 
     # Assertions
-    # Should have called clean_pdf_for_deterministic_output for each input file
+    # Should have appended each input file's single page to the merger
     assert mock_merger.add_page.call_count == 3
     mock_merger.compress_identical_objects.assert_called_once_with(
         remove_identicals=True, remove_orphans=True